@@ -0,0 +1,17 @@
+# Gunicorn configuration for self-hosted deployments:
+#
+#     gunicorn -c gunicorn.conf.py app:application
+#
+# Vercel ignores this file and keeps using the plain WSGI binding in app.py.
+# The gevent worker lets each process multiplex many outbound Gemini sockets
+# instead of parking one thread per in-flight /analyze request.
+
+import os
+
+# Tells app.py to monkey-patch the stdlib before it imports socket/ssl.
+os.environ.setdefault("GUNICORN_WORKER", "gevent")
+
+worker_class = "gevent"
+workers = 2
+worker_connections = 1000
+timeout = 35